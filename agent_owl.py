@@ -7,17 +7,143 @@ Uses screenshot comparison to detect when AI agents are truly idle vs actively t
 Supports custom verification plugins for different use cases.
 """
 
+import asyncio
 import time
+import mss
 import pyautogui
 import pygetwindow as gw
-from datetime import datetime
-from PIL import Image, ImageChops
+from PIL import Image  # Pillow-SIMD works as a drop-in for faster reduce/resize/convert
+import numpy as np
 import os
+import sys
 import json
+import re
+import queue
+import threading
+import hashlib
 import importlib.util
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# A downsampled grayscale screenshot (as a uint8 array) together with a digest
+# of its pixel bytes, a 32x32 thumbnail used as a cheap "nothing changed"
+# signature, and a 64-bit difference hash used as a cheap "clearly changed" test
+HistoryEntry = namedtuple('HistoryEntry', ['digest', 'signature', 'pixels'])
+
+
+try:
+    from numba import njit, prange, types as nb_types
+
+    _GRAY = nb_types.Array(nb_types.uint8, 2, 'C', readonly=True)
+
+    # Rows counted in parallel between early-exit checks
+    _KERNEL_BLOCK_ROWS = 64
+
+    # Compiled eagerly at import so the first comparison doesn't pay for the JIT
+    @njit(nb_types.int64(_GRAY, _GRAY, nb_types.int64), parallel=True, cache=True)
+    def _count_diff_pixels(a, b, max_allowed):
+        """
+        Count positions where two grayscale images differ, one block of rows
+        at a time (each block a parallel reduction), stopping once the count
+        reaches max_allowed
+        """
+        count = 0
+        rows, cols = a.shape
+        for start in range(0, rows, _KERNEL_BLOCK_ROWS):
+            stop = min(start + _KERNEL_BLOCK_ROWS, rows)
+            for i in prange(start, stop):
+                for j in range(cols):
+                    if a[i, j] != b[i, j]:
+                        count += 1
+            if count >= max_allowed:
+                break
+        return count
+except ImportError:
+    # numba not installed - images_are_identical diffs with NumPy
+    _count_diff_pixels = None
+
+
+class _WindowEventWatcher:
+    """
+    Watch a window's process for WinEvents (Windows only)
+
+    A background thread installs out-of-context WinEvent hooks for the
+    process owning the window and pumps messages for them. Any console or
+    object event marks the watcher dirty; the monitor clears the flag just
+    before each capture. If the hooks can't be installed the watcher never becomes
+    usable, so every cycle captures as usual.
+    """
+
+    # (min, max) event ranges: console events, then object events
+    EVENT_RANGES = ((0x4001, 0x40FF), (0x8000, 0x80FF))
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WM_QUIT = 0x0012
+
+    def __init__(self, hwnd):
+        self.hwnd = hwnd
+        self.dirty = True
+        self._thread_id = None
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+        )
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+        ]
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+
+        def on_event(hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+            self.dirty = True
+
+        # Keep a reference so the callback isn't garbage collected
+        self._callback = WinEventProc(on_event)
+
+        pid = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(wintypes.HWND(self.hwnd), ctypes.byref(pid))
+        hooks = [
+            user32.SetWinEventHook(low, high, None, self._callback, pid.value, 0, self.WINEVENT_OUTOFCONTEXT)
+            for low, high in self.EVENT_RANGES
+        ]
+        if not all(hooks):
+            for hook in filter(None, hooks):
+                user32.UnhookWinEvent(hook)
+            self._callback = None
+            return
+
+        # Out-of-context hooks are delivered through this thread's message queue
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+        for hook in hooks:
+            user32.UnhookWinEvent(hook)
+
+    @property
+    def usable(self):
+        """False while the hooks aren't running, so captures must not be skipped"""
+        return self._thread_id is not None
+
+    def stop(self):
+        """Remove the hooks and end the watcher thread"""
+        if self._thread_id is not None:
+            import ctypes
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+            self._thread_id = None
+
+
 class AgentOwl:
     """
     Smart monitor for AI agents using screenshot-based idle detection
@@ -26,6 +152,32 @@ class AgentOwl:
     prompts only when the agent is truly idle (not just thinking).
     """
 
+    OCR_CACHE_SIZE = 8  # recent screenshots whose OCR text is kept
+    COMPARE_TILE_ROWS = 64  # rows compared between early-exit checks
+
+    # OCR keywords indicating a permission prompt
+    _PERMISSION_KW = (
+        'do you want to proceed',
+        'permission',
+        'allow',
+        'enable full access',
+        'approve',
+        'grant access',
+        'authorize',
+        'yes',
+        'no',
+    )
+    # Question indicators, and option patterns (numbered or bulleted lists)
+    _QUESTION_KW = ('which', 'what', 'how', 'would you like', 'choose', 'select', '?')
+    _OPTION_KW = ('1.', '2.', '•', '-', 'option')
+
+    # Keyword matchers, compiled once so each scan is a single pass
+    _PERMISSION_RE = re.compile('|'.join(map(re.escape, _PERMISSION_KW)))
+    _QUESTION_RE = re.compile(
+        f"(?P<question>{'|'.join(map(re.escape, _QUESTION_KW))})"
+        f"|(?P<option>{'|'.join(map(re.escape, _OPTION_KW))})"
+    )
+
     def __init__(self, config_path=None, **kwargs):
         """
         Initialize Agent Owl
@@ -50,8 +202,27 @@ class AgentOwl:
         self.screenshots_to_compare = config.get('screenshots_to_compare', 4)
         self.cooldown = config.get('cooldown_minutes', 15) * 60
         self.screenshot_threshold = config.get('screenshot_threshold', 0.01)
-
-        # Prompts
+        self.event_driven = config.get('event_driven', False)
+
+        # Logging: per-cycle progress lines are only printed when verbose
+        self.verbose = config.get('verbose', True)
+        self._last_ts_sec = None
+        self._last_ts_str = ''
+
+        # Drop pyautogui's default 0.1s pause after every call; the few waits
+        # the UI actually needs are explicit sleeps
+        pyautogui.PAUSE = 0
+        # Image.reduce needs a positive int; JSON may hand us 4.0
+        self.pyramid_downscale = int(config.get('pyramid_downscale', 4))
+        if self.pyramid_downscale < 1:
+            raise ValueError(f"pyramid_downscale must be at least 1, got {self.pyramid_downscale}")
+        self.ocr_bottom_fraction = config.get('ocr_bottom_fraction', 0.3)
+        # Pixels (top, bottom, left, right) of static window chrome left out of
+        # every capture
+        self.content_crop = tuple(config.get('content_crop', (0, 0, 0, 0)))
+
+        # Prompts (pasted via the clipboard unless the target app can't take a paste)
+        self.use_clipboard_paste = config.get('paste_prompts', True)
         self.prompts = config.get('prompts', {
             'default': 'Continue working on the task.',
             'idle': 'You appear to be idle. Please continue with the task.'
@@ -64,14 +235,59 @@ class AgentOwl:
 
         # State
         self.last_prompt_time = 0
-        self.screenshot_history = []
+        self._idle_baseline = None  # first entry of the current unchanged streak
+        self._idle_streak = 0  # screenshots matching the baseline, including it
         self.screenshot_dir = config.get('screenshot_dir', 'screenshots')
+        self.save_screenshots = config.get('save_screenshots', 'on_prompt')  # 'always' | 'on_prompt' | 'never'
+        self._last_capture = None  # (screenshot, digest) of the latest capture
         self.interaction_count = 0
+        self._ocr_cache = OrderedDict()  # screenshot digest -> OCR text
+        self._last_perm = (None, False)  # (digest, result) of last permission check
+        self._last_question = (None, False)  # (digest, result) of last question check
+        self._cached_window = None
+        self._event_watcher = None  # see _window_watcher
+        self._diff_scratch = None  # see _diff_buffer
+        self._sct = mss.mss()  # Reused for every window capture
 
         # Create screenshot directory
         if not os.path.exists(self.screenshot_dir):
             os.makedirs(self.screenshot_dir)
 
+        # OCR and verification run here so they can overlap each other
+        self._worker_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='agent-owl')
+
+        # Screenshots are written to disk by a background thread
+        self._save_q = queue.Queue(maxsize=8)
+        self._last_saved_hash = None
+        threading.Thread(target=self._save_worker, daemon=True).start()
+
+    def _save_worker(self):
+        """Write queued screenshots to disk, skipping repeats of the last one saved"""
+        while True:
+            path, image, digest = self._save_q.get()
+            try:
+                if digest != self._last_saved_hash:
+                    # JPEG encodes far faster than PNG and is plenty for debugging
+                    image.save(path, 'JPEG', quality=70, optimize=False)
+                    self._last_saved_hash = digest
+            except Exception as e:
+                self.log(f"Error saving screenshot: {e}")
+            finally:
+                self._save_q.task_done()
+
+    def _queue_save(self, screenshot, digest):
+        """Hand a screenshot to the background writer"""
+        screenshot_path = os.path.join(self.screenshot_dir, f"agent_{int(time.time())}.jpg")
+        try:
+            self._save_q.put_nowait((screenshot_path, screenshot, digest))
+        except queue.Full:
+            self.log("Screenshot save queue full, skipping save")
+
+    def _save_last_capture(self):
+        """In 'on_prompt' mode, save the screenshot that led to acting on the window"""
+        if self.save_screenshots == 'on_prompt' and self._last_capture is not None:
+            self._queue_save(*self._last_capture)
+
     def _load_verification_plugin(self, plugin_path):
         """Load a custom verification plugin"""
         try:
@@ -83,46 +299,85 @@ class AgentOwl:
             self.log(f"✗ Failed to load verification plugin: {e}")
             self.verification_module = None
 
-    def log(self, message):
-        """Log with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    def log(self, message, *args, verbose=False):
+        """
+        Log with timestamp
+
+        Args are %-formatted into the message only when the line is printed;
+        verbose lines are dropped unless the verbose setting is on.
+        """
+        if verbose and not self.verbose:
+            return
+        if args:
+            message = message % args
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
         try:
-            print(f"[{timestamp}] {message}")
+            print(f"[{self._last_ts_str}] {message}")
         except UnicodeEncodeError:
             safe_message = message.encode('ascii', errors='replace').decode('ascii')
-            print(f"[{timestamp}] {safe_message}")
+            print(f"[{self._last_ts_str}] {safe_message}")
 
     def find_window(self):
+        """
+        Find the target window, reusing the one found previously while it is
+        still valid
+        """
+        if self._cached_window is not None:
+            try:
+                if self._cached_window_valid():
+                    return self._cached_window
+            except Exception:
+                pass  # pygetwindow raises on dead window handles
+            self._cached_window = None
+
+        window = self._search_window()
+        self._cached_window = window
+        return window
+
+    def _cached_window_valid(self):
+        """Check whether the cached window can still be used without a new search"""
+        window = self._cached_window
+        try:
+            import win32gui
+        except ImportError:
+            # Without pywin32 the window was found by title, so keep it while
+            # it is visible and still matches the pattern
+            pattern = (self.window_pattern or '').lower()
+            return bool(pattern) and window.visible and pattern in window.title.lower()
+        return bool(win32gui.IsWindow(window._hWnd))
+
+    def _search_window(self):
         """Find the target window by checking for terminal emulators hosting PowerShell"""
         try:
             import psutil
             windows = gw.getAllWindows()
 
-            # Get terminal emulator process IDs (Windows Terminal, ConHost, etc.)
-            terminal_pids = []
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    proc_name = proc.info['name'].lower()
-                    # Look for Windows Terminal, OpenConsole, or ConHost processes
-                    if any(term in proc_name for term in ['windowsterminal', 'openconsole', 'conhost']):
-                        terminal_pids.append(proc.info['pid'])
-                except:
-                    pass
-
             # Try Windows-specific window-to-process mapping
             try:
                 import win32process
                 import win32gui
 
-                # Collect terminal windows with scoring
+                # Collect terminal windows with scoring. Only processes that own a
+                # window are looked up, each at most once.
                 terminal_windows = []
+                process_names = {}
                 for window in windows:
                     try:
                         # Get process ID for this window
                         _, window_pid = win32process.GetWindowThreadProcessId(window._hWnd)
+                        if window_pid not in process_names:
+                            try:
+                                process_names[window_pid] = psutil.Process(window_pid).name().lower()
+                            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                process_names[window_pid] = ''
 
                         # Check if this window belongs to a terminal process
-                        if window_pid in terminal_pids:
+                        # (Windows Terminal, OpenConsole, or ConHost)
+                        proc_name = process_names[window_pid]
+                        if any(term in proc_name for term in ['windowsterminal', 'openconsole', 'conhost']):
                             # Score the window based on various criteria
                             score = 0
 
@@ -158,9 +413,8 @@ class AgentOwl:
 
             # Fallback: check by window title pattern
             if self.window_pattern:
-                for window in windows:
-                    if self.window_pattern.lower() in window.title.lower():
-                        return window
+                pattern = self.window_pattern.lower()
+                return next((window for window in windows if pattern in window.title.lower()), None)
 
             return None
         except Exception as e:
@@ -199,48 +453,132 @@ class AgentOwl:
                 except:
                     return None
 
-            # Ensure coordinates are within screen bounds
-            if x < 0:
-                width += x
-                x = 0
-            if y < 0:
-                height += y
-                y = 0
+            # Leave out the configured window chrome so it is never read
+            crop_top, crop_bottom, crop_left, crop_right = self.content_crop
+            x, y = x + crop_left, y + crop_top
+            width -= crop_left + crop_right
+            height -= crop_top + crop_bottom
+
+            # Clip to the virtual screen spanning all monitors, so windows on a
+            # monitor left of or above the primary one (negative coordinates)
+            # are still captured
+            screen = self._sct.monitors[0]
+            left = max(x, screen['left'])
+            top = max(y, screen['top'])
+            right = min(x + width, screen['left'] + screen['width'])
+            bottom = min(y + height, screen['top'] + screen['height'])
+            x, y, width, height = left, top, right - left, bottom - top
 
             if width <= 0 or height <= 0:
                 self.log(f"Window outside screen bounds")
                 return None
 
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
+            # Grab only the window rectangle straight into a BGRA buffer
+            raw = self._sct.grab({'left': x, 'top': y, 'width': width, 'height': height})
+            screenshot = Image.frombuffer('RGB', raw.size, raw.bgra, 'raw', 'BGRX')
             return screenshot
         except Exception as e:
             self.log(f"Error capturing screenshot: {e}")
+            self._cached_window = None  # Look the window up again next cycle
             return None
 
+    def _diff_buffer(self, shape):
+        """
+        Return the scratch array NumPy tile diffs are written into
+
+        Reused across comparisons and only reallocated when the image layout
+        changes (e.g. the window was resized).
+        """
+        tile_shape = (self.COMPARE_TILE_ROWS,) + tuple(shape[1:])
+        if self._diff_scratch is None or self._diff_scratch.shape != tile_shape:
+            self._diff_scratch = np.empty(tile_shape, dtype=bool)
+        return self._diff_scratch
+
     def images_are_identical(self, img1, img2):
         """
         Compare two images and return True if essentially identical
 
+        Compares COMPARE_TILE_ROWS rows at a time and stops as soon as the
+        differing pixels reach the threshold. Grayscale images go through the
+        numba kernel in a single call when it is available, which does the
+        same early exit without leaving compiled code.
+
         Args:
-            img1, img2: PIL Images to compare
+            img1, img2: PIL Images or uint8 arrays to compare
         """
         try:
-            if img1.size != img2.size:
+            a = np.ascontiguousarray(img1)
+            b = np.ascontiguousarray(img2)
+            if a.shape != b.shape:
                 return False
+            if a is b:
+                return True
 
-            diff = ImageChops.difference(img1, img2)
-            diff_gray = diff.convert('L')
-            histogram = diff_gray.histogram()
-
-            total_pixels = img1.size[0] * img1.size[1]
-            diff_pixels = sum(histogram[1:])
-            diff_percentage = diff_pixels / total_pixels
+            total_pixels = a.shape[0] * a.shape[1]
+            max_diff_pixels = self.screenshot_threshold * total_pixels
+
+            if a.ndim == 2 and a.dtype == np.uint8 and _count_diff_pixels is not None:
+                max_allowed = int(np.ceil(max_diff_pixels))
+                return _count_diff_pixels(a, b, max_allowed) < max_allowed
+
+            diff_pixels = 0
+            for row in range(0, a.shape[0], self.COMPARE_TILE_ROWS):
+                tile_a = a[row:row + self.COMPARE_TILE_ROWS]
+                tile_b = b[row:row + self.COMPARE_TILE_ROWS]
+                changed = np.not_equal(tile_a, tile_b, out=self._diff_buffer(a.shape)[:len(tile_a)])
+                # A pixel counts as different if any of its channels differ
+                if changed.ndim == 3:
+                    changed = changed.any(axis=-1)
+                diff_pixels += int(np.count_nonzero(changed))
+                if diff_pixels >= max_diff_pixels:
+                    return False
 
-            return diff_percentage < self.screenshot_threshold
+            return True
         except Exception as e:
             self.log(f"Error comparing images: {e}")
             return False
 
+    def _comparison_image(self, screenshot):
+        """
+        Shrink a screenshot to the grayscale image used for idle comparisons
+
+        Each side is reduced by pyramid_downscale with a box filter (one coarse
+        pyramid level), then converted to grayscale on the small image.
+        """
+        return screenshot.reduce(self.pyramid_downscale).convert('L')
+
+    def _thumb_signature(self, img):
+        """Summarize an image as a 32x32 grayscale thumbnail for quick change checks"""
+        return np.asarray(img.resize((32, 32), Image.BILINEAR).convert('L'))
+
+    def _history_entry(self, screenshot):
+        """
+        Build the history entry for a screenshot
+
+        The downsampled pixels are extracted once and the digest is computed
+        straight from that array, so each frame is decoded a single time.
+        """
+        small = self._comparison_image(screenshot)
+        pixels = np.asarray(small)
+        digest = hashlib.blake2b(pixels, digest_size=8).digest()
+        return HistoryEntry(digest, self._thumb_signature(small), pixels)
+
+    def _entries_match(self, older, newer):
+        """
+        Compare two history entries, using the cheapest test that decides
+
+        Equal digests match outright. With a fuzzy threshold, same-size frames
+        whose thumbnails are unchanged match. Only the rest need a pixel diff.
+        """
+        if older.digest == newer.digest:
+            return True
+        if self.screenshot_threshold == 0:
+            return False
+        same_size = older.pixels.shape == newer.pixels.shape
+        if same_size and np.array_equal(older.signature, newer.signature):
+            return True
+        return self.images_are_identical(older.pixels, newer.pixels)
+
     def is_agent_truly_idle(self, window, current_screenshot=None):
         """
         Determine if agent is truly idle by comparing screenshots
@@ -252,68 +590,98 @@ class AgentOwl:
         if not current_screenshot:
             return False
 
-        # Save screenshot
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = os.path.join(self.screenshot_dir, f"agent_{timestamp}.png")
-        current_screenshot.save(screenshot_path)
+        # Downsample and hash once, so unchanged frames can be compared (and
+        # skipped when saving) without a pixel diff
+        entry = self._history_entry(current_screenshot)
+
+        # Save screenshot in the background, or keep it until we act on the window
+        self._last_capture = (current_screenshot, entry.digest)
+        if self.save_screenshots == 'always':
+            self._queue_save(current_screenshot, entry.digest)
 
-        # Add to history (keep only last N)
-        self.screenshot_history.append(current_screenshot)
-        if len(self.screenshot_history) > self.screenshots_to_compare:
-            self.screenshot_history.pop(0)
+        # Compare against the first screenshot of the current unchanged streak,
+        # so each capture needs one comparison and only the baseline is kept
+        if self._idle_baseline is not None and self._entries_match(self._idle_baseline, entry):
+            self._idle_streak += 1
+        else:
+            changed = self._idle_baseline is not None
+            self._idle_baseline = entry
+            self._idle_streak = 1
+            if changed:
+                self.log(f"✓ Agent is ACTIVE (screenshots show changes - likely thinking/working)")
+                return False
 
-        # Need at least N screenshots to compare
-        if len(self.screenshot_history) < self.screenshots_to_compare:
-            self.log(f"Collecting screenshots ({len(self.screenshot_history)}/{self.screenshots_to_compare})...")
+        # Need N matching screenshots in a row
+        if self._idle_streak < self.screenshots_to_compare:
+            self.log("Collecting screenshots (%d/%d)...", self._idle_streak,
+                     self.screenshots_to_compare, verbose=True)
             return False
 
-        # Check if all recent screenshots are identical
-        all_identical = True
-        for i in range(len(self.screenshot_history) - 1):
-            if not self.images_are_identical(self.screenshot_history[i], self.screenshot_history[i + 1]):
-                all_identical = False
-                break
+        self.log(f"✓ Agent appears TRULY idle (last {self.screenshots_to_compare} screenshots identical)")
+        return True
 
-        if all_identical:
-            self.log(f"✓ Agent appears TRULY idle (last {self.screenshots_to_compare} screenshots identical)")
-            return True
-        else:
-            self.log(f"✓ Agent is ACTIVE (screenshots show changes - likely thinking/working)")
-            return False
+    def _reset_idle_tracking(self):
+        """Forget the current unchanged-screenshot streak"""
+        self._idle_baseline = None
+        self._idle_streak = 0
+
+    def _ocr_text(self, screenshot):
+        """
+        OCR the bottom of a screenshot to lowercase text, memoized on its pixels
+
+        Prompts appear at the bottom of the terminal, so only the bottom
+        ocr_bottom_fraction of the window is read, binarized for Tesseract.
+        Raises ImportError if pytesseract is not installed.
+        """
+        import pytesseract
+
+        width, height = screenshot.size
+        top = int(height * (1 - self.ocr_bottom_fraction))
+        region = screenshot.crop((0, top, width, height)).convert('L')
+        region = region.point(lambda p: 255 if p > 128 else 0, mode='1')
+
+        key = hashlib.blake2b(region.tobytes(), digest_size=8).digest()
+        if key in self._ocr_cache:
+            self._ocr_cache.move_to_end(key)
+            return self._ocr_cache[key]
+
+        text = pytesseract.image_to_string(region).lower()
+        self._ocr_cache[key] = text
+        if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        return text
 
-    def detect_permission_prompt(self, screenshot):
+    def detect_permission_prompt(self, screenshot, digest=None):
         """
         Detect if the screenshot shows a permission prompt
         Uses both OCR (if available) and pixel-based detection
+
+        Args:
+            screenshot: PIL Image to check
+            digest: Screenshot digest; if it matches the last checked frame,
+                the previous result is returned without running OCR
         """
+        if digest is not None and self._last_perm[0] == digest:
+            return self._last_perm[1]
+
         try:
+            detected = False
+
             # Try OCR-based detection first
             try:
-                import pytesseract
-                text = pytesseract.image_to_string(screenshot).lower()
-
-                permission_keywords = [
-                    'do you want to proceed',
-                    'permission',
-                    'allow',
-                    'enable full access',
-                    'approve',
-                    'grant access',
-                    'authorize',
-                    'yes',
-                    'no'
-                ]
-
-                for keyword in permission_keywords:
-                    if keyword in text:
-                        self.log(f"🔒 Permission prompt detected (OCR): '{keyword}'")
-                        return True
+                text = self._ocr_text(screenshot)
+
+                match = self._PERMISSION_RE.search(text)
+                if match:
+                    self.log(f"🔒 Permission prompt detected (OCR): '{match.group()}'")
+                    detected = True
             except ImportError:
                 # OCR not available - permission detection disabled
                 # Install pytesseract for automatic permission approval
                 pass
 
-            return False
+            self._last_perm = (digest, detected)
+            return detected
         except Exception as e:
             self.log(f"Error detecting permission prompt: {e}")
             return False
@@ -336,64 +704,58 @@ class AgentOwl:
 
             # Press down arrow 2-3 times to select "Enable full access" option
             # (usually the last/bottom option in Claude's permission prompts)
-            for i in range(3):
+            for _ in range(3):
                 pyautogui.press('down')
-                time.sleep(0.1)
 
-            # Press Enter to confirm
-            time.sleep(0.3)
+            # Let the selection settle, then press Enter to confirm
+            time.sleep(0.2)
             pyautogui.press('enter')
-            time.sleep(0.5)
 
             self.log("✓ Permission approved successfully")
-            self.screenshot_history = []  # Clear history after approval
+            self._save_last_capture()
+            self._reset_idle_tracking()  # Start over after approval
             return True
         except Exception as e:
             self.log(f"Error approving permission: {e}")
             return False
 
-    def detect_question_prompt(self, screenshot):
+    def detect_question_prompt(self, screenshot, digest=None):
         """
         Detect if the screenshot shows a multiple-choice question from Claude
         Looks for numbered options, bullet points, or question patterns
+
+        Args:
+            screenshot: PIL Image to check
+            digest: Screenshot digest; if it matches the last checked frame,
+                the previous result is returned without running OCR
         """
+        if digest is not None and self._last_question[0] == digest:
+            return self._last_question[1]
+
         try:
+            detected = False
+
             # Try OCR-based detection
             try:
-                import pytesseract
-                text = pytesseract.image_to_string(screenshot).lower()
-
-                # Look for question indicators
-                question_patterns = [
-                    'which',
-                    'what',
-                    'how',
-                    'would you like',
-                    'choose',
-                    'select',
-                    '?',
-                ]
-
-                # Look for option patterns (numbered or bulleted lists)
-                option_patterns = [
-                    '1.',
-                    '2.',
-                    '•',
-                    '-',
-                    'option',
-                ]
-
-                has_question = any(pattern in text for pattern in question_patterns)
-                has_options = any(pattern in text for pattern in option_patterns)
-
-                if has_question and has_options:
+                text = self._ocr_text(screenshot)
+
+                # Single scan for both question indicators and option patterns,
+                # stopping as soon as one of each has been seen
+                found = set()
+                for match in self._QUESTION_RE.finditer(text):
+                    found.add(match.lastgroup)
+                    if len(found) == 2:
+                        break
+
+                if len(found) == 2:
                     self.log(f"❓ Question prompt detected - Claude is asking for input")
-                    return True
+                    detected = True
             except ImportError:
                 # OCR not available - question detection disabled
                 pass
 
-            return False
+            self._last_question = (digest, detected)
+            return detected
         except Exception as e:
             self.log(f"Error detecting question prompt: {e}")
             return False
@@ -417,10 +779,10 @@ class AgentOwl:
             # Simply press Enter to select the first/default option
             # Claude typically highlights the first option by default
             pyautogui.press('enter')
-            time.sleep(0.5)
 
             self.log("✓ Question answered successfully (selected top option)")
-            self.screenshot_history = []  # Clear history after answering
+            self._save_last_capture()
+            self._reset_idle_tracking()  # Start over after answering
             return True
         except Exception as e:
             self.log(f"Error answering question: {e}")
@@ -455,6 +817,21 @@ class AgentOwl:
 
         return self.prompts.get('default', 'Continue working on the task.')
 
+    def _paste_message(self, message):
+        """Paste a message via the clipboard; returns False if the clipboard is unavailable"""
+        try:
+            import pyperclip
+        except ImportError:
+            return False
+
+        try:
+            pyperclip.copy(message)
+        except pyperclip.PyperclipException:
+            return False
+
+        pyautogui.hotkey('ctrl', 'v')
+        return True
+
     def send_prompt(self, window, message):
         """Send a continuation prompt to the agent"""
         try:
@@ -480,13 +857,17 @@ class AgentOwl:
                 pyautogui.click(click_x, click_y)
                 time.sleep(0.5)
 
-                # Type message
-                pyautogui.write(message, interval=0.05)
-                time.sleep(0.3)
+                # Paste message, falling back to typing it out
+                if self.use_clipboard_paste and self._paste_message(message):
+                    time.sleep(0.1)
+                else:
+                    pyautogui.write(message, interval=0.05)
+                    time.sleep(0.3)
                 pyautogui.press('enter')
 
                 self.last_prompt_time = time.time()
-                self.screenshot_history = []  # Clear history after prompt
+                self._save_last_capture()
+                self._reset_idle_tracking()  # Start over after prompt
                 self.interaction_count += 1
 
                 self.log("✓ Prompt sent successfully")
@@ -499,10 +880,31 @@ class AgentOwl:
             self.log(f"Error sending prompt: {e}")
             return False
 
-    def run_check_cycle(self):
+    def _window_watcher(self, window):
+        """
+        Return the WinEvent watcher for window, starting one if needed
+
+        Returns None unless event_driven is enabled on Windows.
+        """
+        if not self.event_driven or sys.platform != 'win32':
+            return None
+
+        if self._event_watcher is None or self._event_watcher.hwnd != window._hWnd:
+            if self._event_watcher is not None:
+                self._event_watcher.stop()
+            self._event_watcher = _WindowEventWatcher(window._hWnd)
+        return self._event_watcher
+
+    def _detect_prompts(self, screenshot, digest):
+        """Run both prompt detectors; returns (permission_prompt, question_prompt)"""
+        if self.detect_permission_prompt(screenshot, digest):
+            return True, False
+        return False, self.detect_question_prompt(screenshot, digest)
+
+    async def run_check_cycle(self):
         """Run one monitoring cycle"""
-        self.log("=" * 60)
-        self.log("Running check cycle...")
+        self.log("=" * 60, verbose=True)
+        self.log("Running check cycle...", verbose=True)
 
         # Find window
         window = self.find_window()
@@ -510,12 +912,31 @@ class AgentOwl:
             self.log(f"✗ Window not found (pattern: '{self.window_pattern}')")
             return False
 
-        self.log(f"✓ Found window: {window.title}")
-
-        # Capture screenshot once for all checks
-        current_screenshot = self.capture_window_screenshot(window)
-        if not current_screenshot:
-            return False
+        self.log("✓ Found window: %s", window.title, verbose=True)
+
+        # Capture screenshot once for all checks. In event-driven mode, a window
+        # that raised no events since the last capture is unchanged, so that
+        # capture is reused - but only for intermediate cycles of the idle
+        # streak. The frame that would complete it, and any frame the monitor
+        # may act on, is always captured fresh, since some terminals redraw
+        # without raising events.
+        watcher = self._window_watcher(window)
+        streak_completes = self._idle_streak + 1 >= self.screenshots_to_compare
+        if (watcher is not None and watcher.usable and not watcher.dirty
+                and self._last_capture is not None and not streak_completes):
+            self.log("No window events since last check - reusing previous screenshot", verbose=True)
+            current_screenshot = self._last_capture[0]
+        else:
+            # Clear the flag before grabbing so events during the grab mark the
+            # next cycle dirty. Until the hooks are live, events can be missed,
+            # so the flag stays set and the next cycle captures again.
+            if watcher is not None and watcher.usable:
+                watcher.dirty = False
+            current_screenshot = self.capture_window_screenshot(window)
+            if not current_screenshot:
+                if watcher is not None:
+                    watcher.dirty = True
+                return False
 
         # Check if truly idle using screenshots
         truly_idle = self.is_agent_truly_idle(window, current_screenshot)
@@ -523,21 +944,37 @@ class AgentOwl:
         if not truly_idle:
             return True
 
+        # Reuse the digest computed for idle detection, so OCR only runs when
+        # the frame has changed since the last prompt check
+        digest = self._last_capture[1]
+
+        # Agent is idle - OCR for permission/question prompts in the worker
+        # pool. If a continuation prompt may be due, run verification alongside
+        # it instead of after it.
+        loop = asyncio.get_running_loop()
+        time_since_last_prompt = time.time() - self.last_prompt_time
+        cooldown_active = time_since_last_prompt < self.cooldown
+        detection = loop.run_in_executor(self._worker_pool, self._detect_prompts, current_screenshot, digest)
+        if cooldown_active:
+            (permission_prompt, question_prompt), message = await detection, None
+        else:
+            verification = loop.run_in_executor(self._worker_pool, self.get_prompt_message)
+            (permission_prompt, question_prompt), message = await asyncio.gather(detection, verification)
+
         # Agent is idle - check if it's waiting for permission
-        if self.detect_permission_prompt(current_screenshot):
+        if permission_prompt:
             self.log("✓ Detected permission prompt while agent is idle")
             self.approve_permission(window)
             return True
 
         # Agent is idle - check if it's waiting for an answer to a question
-        if self.detect_question_prompt(current_screenshot):
+        if question_prompt:
             self.log("✓ Detected question prompt while agent is idle")
             self.answer_question(window)
             return True
 
         # Agent is idle - check cooldown
-        time_since_last_prompt = time.time() - self.last_prompt_time
-        if time_since_last_prompt < self.cooldown:
+        if cooldown_active:
             cooldown_remaining = int(self.cooldown - time_since_last_prompt)
             minutes_remaining = cooldown_remaining // 60
             seconds_remaining = cooldown_remaining % 60
@@ -545,10 +982,17 @@ class AgentOwl:
             return True
 
         # Ready to send prompt
-        message = self.get_prompt_message()
         self.send_prompt(window, message)
         return True
 
+    async def _main(self):
+        """Check the window every check_interval seconds, forever"""
+        while True:
+            await self.run_check_cycle()
+            self.log("Waiting %ss until next check...", self.check_interval, verbose=True)
+            self.log("", verbose=True)
+            await asyncio.sleep(self.check_interval)
+
     def run(self):
         """Main monitoring loop"""
         self.log("=" * 60)
@@ -573,11 +1017,7 @@ class AgentOwl:
         self.log("")
 
         try:
-            while True:
-                self.run_check_cycle()
-                self.log(f"Waiting {self.check_interval}s until next check...")
-                self.log("")
-                time.sleep(self.check_interval)
+            asyncio.run(self._main())
         except KeyboardInterrupt:
             self.log("\n" + "=" * 60)
             self.log(f"  Monitor stopped - {self.interaction_count} prompts sent")
@@ -585,6 +1025,10 @@ class AgentOwl:
         except Exception as e:
             self.log(f"Unexpected error: {e}")
             raise
+        finally:
+            # Let screenshots already queued finish writing before exiting
+            self._save_q.join()
+            self._worker_pool.shutdown(wait=True)
 
 
 def main():
@@ -634,12 +1078,14 @@ Examples:
 
     # Check dependencies
     try:
+        import mss
         import pyautogui
         import pygetwindow
         from PIL import Image
+        import numpy
     except ImportError:
         print("Missing dependencies. Please install:")
-        print("  pip install pyautogui pygetwindow Pillow")
+        print("  pip install mss pyautogui pygetwindow Pillow numpy")
         return
 
     # Build kwargs from args
@@ -653,6 +1099,12 @@ Examples:
     if args.cooldown:
         kwargs['cooldown_minutes'] = args.cooldown
 
+    # Replace characters the console can't encode (emoji on cp1252) instead of
+    # raising; log() still falls back to ASCII for streams that can't be
+    # reconfigured
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(errors='replace')
+
     # Create and run monitor
     owl = AgentOwl(config_path=args.config, **kwargs)
     owl.run()
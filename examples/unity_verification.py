@@ -7,6 +7,31 @@ Checks Unity Editor state and determines appropriate prompts.
 import psutil
 import os
 import re
+import time
+
+
+# Log lines matching any of these patterns indicate a Unity error. Compiled
+# once into a single alternation so each line is scanned in one pass.
+_ERROR_PATTERNS = [
+    r"Canvas.*not.*visible",
+    r"Button.*not.*rendered",
+    r"UI.*out of.*bounds",
+    r"RectTransform.*invalid",
+    r"NullReferenceException",
+    r"Error.*MainMenu"
+]
+_ERROR_REGEX = re.compile('|'.join(f'(?:{p})' for p in _ERROR_PATTERNS), re.IGNORECASE)
+
+# Only the end of Editor.log is read - it can grow to hundreds of MB
+_LOG_TAIL_BYTES = 64 * 1024
+
+# Errors found in the log for a given (size, mtime) fingerprint, reused while
+# the log is unchanged
+_LOG_CACHE = {'fp': None, 'errors': []}
+
+# Result of the last Unity process scan, reused for _PROC_CACHE_TTL seconds
+_PROC_CACHE_TTL = 30
+_PROC_CACHE = {'t': 0, 'running': False, 'names': []}
 
 
 def verify():
@@ -19,17 +44,24 @@ def verify():
             - message: str description of current state
             - prompt_override: str or None to override configured prompts
     """
-    # Check if Unity is running
-    unity_running = False
-    unity_processes = []
+    # Check if Unity is running (stopping at the first Unity process found)
+    now = time.time()
+    if now - _PROC_CACHE['t'] < _PROC_CACHE_TTL:
+        unity_running, unity_processes = _PROC_CACHE['running'], _PROC_CACHE['names']
+    else:
+        unity_running = False
+        unity_processes = []
 
-    for proc in psutil.process_iter(['name']):
-        try:
-            if 'unity' in proc.info['name'].lower():
-                unity_running = True
-                unity_processes.append(proc.info['name'])
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+        for proc in psutil.process_iter(['name']):
+            try:
+                if 'unity' in proc.info['name'].lower():
+                    unity_running = True
+                    unity_processes.append(proc.info['name'])
+                    break
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        _PROC_CACHE.update(t=now, running=unity_running, names=unity_processes)
 
     if not unity_running:
         return 'unity_not_running', 'Unity is not running', None
@@ -38,26 +70,28 @@ def verify():
     unity_log_path = os.path.expanduser(r"~\AppData\Local\Unity\Editor\Editor.log")
 
     errors_found = []
-    if os.path.exists(unity_log_path):
+    try:
+        st = os.stat(unity_log_path)
+    except OSError:
+        st = None
+    if st is not None:
         try:
-            with open(unity_log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                recent_lines = lines[-100:] if len(lines) > 100 else lines
-
-                error_patterns = [
-                    r"Canvas.*not.*visible",
-                    r"Button.*not.*rendered",
-                    r"UI.*out of.*bounds",
-                    r"RectTransform.*invalid",
-                    r"NullReferenceException",
-                    r"Error.*MainMenu"
-                ]
+            fp = (st.st_size, st.st_mtime_ns)
+            if fp == _LOG_CACHE['fp']:
+                errors_found = _LOG_CACHE['errors']
+            else:
+                with open(unity_log_path, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    f.seek(max(0, f.tell() - _LOG_TAIL_BYTES))
+                    tail = f.read().decode('utf-8', errors='ignore')
+                recent_lines = tail.splitlines()[-100:]
 
                 for line in recent_lines:
-                    for pattern in error_patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            errors_found.append(line.strip())
-                            break
+                    if _ERROR_REGEX.search(line):
+                        errors_found.append(line.strip())
+
+                _LOG_CACHE['fp'] = fp
+                _LOG_CACHE['errors'] = errors_found
         except Exception as e:
             return 'error', f'Could not read Unity log: {e}', None
 